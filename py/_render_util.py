@@ -1,50 +1,141 @@
+import os
 import sys
 import wave
 import struct
 import inspect
+import importlib
+import importlib.util
+import multiprocessing as mp
+from functools import lru_cache
 import numpy as np
 
 
+_TIME_AXIS = None
+
+
+def time_axis(n: int, sr: int) -> np.ndarray:
+    """Return sample times arange(n) / sr as a read-only float32 view.
+
+    The axis is cached for the last sample rate and only rebuilt when a
+    longer one is requested, so per-hit callers share one buffer.
+    """
+    global _TIME_AXIS
+    if _TIME_AXIS is None or _TIME_AXIS[0] != sr or _TIME_AXIS[1].size < n:
+        t = np.arange(n, dtype=np.float32) / float(sr)
+        t.flags.writeable = False
+        _TIME_AXIS = (sr, t)
+    return _TIME_AXIS[1][:n]
+
+
+@lru_cache(maxsize=32)
+def fade_ramp(n: int) -> np.ndarray:
+    """Return a cached read-only 0 -> 1 float32 ramp of n samples for edge fades.
+
+    Reverse it with ramp[::-1] for the fade-out.
+    """
+    ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+    ramp.flags.writeable = False
+    return ramp
+
+
+@lru_cache(maxsize=32)
+def decay_ramp(n: int) -> np.ndarray:
+    """Return a cached read-only 1 -> 0 float32 ramp of n samples for envelopes."""
+    ramp = np.linspace(1.0, 0.0, n, dtype=np.float32)
+    ramp.flags.writeable = False
+    return ramp
+
+
+def mono_to_stereo(y: np.ndarray) -> np.ndarray:
+    """Duplicate a mono signal into a (samples, 2) float32 array."""
+    out = np.empty((len(y), 2), dtype=np.float32)
+    out[:, 0] = y
+    out[:, 1] = y
+    return out
+
+
 def _normalize_audio(y: np.ndarray) -> np.ndarray:
     if y is None:
         return np.zeros((0,), dtype=np.float32)
-    y = np.asarray(y, dtype=np.float32)
-    if y.ndim == 2:
-        # Accept shape (channels, samples) or (samples, channels)
-        if y.shape[0] in (1, 2) and y.shape[1] > 2:
-            y = y.T
+    if not (isinstance(y, np.ndarray) and y.dtype == np.float32):
+        y = np.asarray(y, dtype=np.float32)
     if y.ndim == 1:
         return y
     if y.ndim == 2:
+        # Accept shape (channels, samples) or (samples, channels)
+        if y.shape[0] in (1, 2) and y.shape[1] > 2:
+            return y.T
         return y
     return y.reshape(-1)
 
 
-def _to_int16(y: np.ndarray) -> np.ndarray:
-    y = np.clip(y, -1.0, 1.0)
-    return (y * 32767.0).astype(np.int16)
+def _to_int16(y: np.ndarray, buf: np.ndarray = None, out: np.ndarray = None) -> np.ndarray:
+    buf = np.clip(y, -1.0, 1.0, out=buf)
+    if out is None:
+        out = np.empty(buf.shape, dtype=np.int16)
+    # Scale straight into the int16 destination; the unsafe cast truncates
+    # the same way astype(np.int16) does, without the extra copy.
+    return np.multiply(buf, 32767.0, out=out, casting="unsafe")
+
+
+_WRITE_CHUNK = 1 << 16
+
+
+def _write_int16(wf, frames: np.ndarray):
+    # Convert in fixed-size blocks through reusable scratch buffers so peak
+    # memory stays near the float input instead of adding full int16/bytes copies.
+    shape = (min(_WRITE_CHUNK, len(frames)),) + frames.shape[1:]
+    buf = np.empty(shape, dtype=np.float32)
+    out = np.empty(shape, dtype=np.int16)
+    for i in range(0, len(frames), _WRITE_CHUNK):
+        block = frames[i:i + _WRITE_CHUNK]
+        data = _to_int16(block, buf[: len(block)], out[: len(block)])
+        wf.writeframes(data.tobytes())
+
+
+def _write_float32(path: str, sr: int, frames: np.ndarray, channels: int):
+    # The wave module only writes integer PCM, so emit the RIFF header for
+    # IEEE float (format tag 3, with the fact chunk non-PCM files carry).
+    n = len(frames)
+    block_align = channels * 4
+    data_size = n * block_align
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sI4s", b"RIFF", 50 + data_size, b"WAVE"))
+        f.write(struct.pack("<4sIHHIIHHH", b"fmt ", 18, 3, channels, int(sr),
+                            int(sr) * block_align, block_align, 32, 0))
+        f.write(struct.pack("<4sII", b"fact", 4, n))
+        f.write(struct.pack("<4sI", b"data", data_size))
+        for i in range(0, n, _WRITE_CHUNK):
+            f.write(frames[i:i + _WRITE_CHUNK].astype("<f4", copy=False).tobytes())
+
 
+def write_wav(path: str, sr: int, y: np.ndarray, subtype: str = "int16"):
+    if subtype not in ("int16", "float32"):
+        raise ValueError(f"Unsupported WAV subtype: {subtype!r}")
 
-def write_wav(path: str, sr: int, y: np.ndarray):
     y = _normalize_audio(y)
-    if y.ndim == 1:
-        channels = 1
-        frames = y
-    else:
-        channels = y.shape[1]
-        frames = y
+    channels = 1 if y.ndim == 1 else y.shape[1]
+
+    if subtype == "float32":
+        # Samples are written as-is: no clipping or integer conversion.
+        _write_float32(path, sr, y, channels)
+        return
 
     with wave.open(path, "wb") as wf:
         wf.setnchannels(channels)
         wf.setsampwidth(2)
         wf.setframerate(int(sr))
+        _write_int16(wf, y)
+
 
-        if channels == 1:
-            data = _to_int16(frames)
-            wf.writeframes(data.tobytes())
-        else:
-            data = _to_int16(frames)
-            wf.writeframes(data.tobytes())
+def _call_generate(generate_fn, sr: int, duration: float):
+    sig = inspect.signature(generate_fn)
+    try:
+        if len(sig.parameters) >= 3:
+            return generate_fn(sr, duration, {})
+        return generate_fn(sr, duration)
+    except TypeError:
+        return generate_fn(sr, duration)
 
 
 def render_cli(generate_fn):
@@ -56,17 +147,69 @@ def render_cli(generate_fn):
     sr = int(float(sys.argv[2]))
     duration = float(sys.argv[3])
 
-    sig = inspect.signature(generate_fn)
+    y = _call_generate(generate_fn, sr, duration)
+    write_wav(out_path, sr, y)
+
+
+def _load_generate(source: str):
+    # Accept either a path to a synth .py file or an importable module name.
+    if source.endswith(".py"):
+        folder = os.path.dirname(os.path.abspath(source))
+        if folder not in sys.path:
+            sys.path.insert(0, folder)
+        name = os.path.splitext(os.path.basename(source))[0]
+        spec = importlib.util.spec_from_file_location(name, source)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.generate
+    return importlib.import_module(source).generate
+
+
+_THREAD_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def _render_one(source: str, out_path: str, sr: int, duration: float, subtype: str):
+    y = _call_generate(_load_generate(source), sr, duration)
+    write_wav(out_path, sr, y, subtype)
+    return out_path
+
+
+def render_batch(jobs, sr: int, duration: float, workers: int = None, subtype: str = "int16"):
+    """Render (generator, output.wav) pairs across a process pool.
+
+    Each generator is a synth .py path or module name. Jobs are independent,
+    so they are farmed out one per process.
+    """
+    args = [(source, out_path, int(sr), float(duration), subtype) for source, out_path in jobs]
+    if not args:
+        return []
+
+    # Spawned workers (the macOS default) load NumPy fresh from the
+    # environment they start with, so limiting BLAS/OpenMP threads there keeps
+    # them from oversubscribing the cores the pool already spreads jobs over.
+    # Forked workers inherit the parent's already-running thread pool, which
+    # this cannot change.
+    saved = {var: os.environ.get(var) for var in _THREAD_VARS}
+    os.environ.update({var: "1" for var in _THREAD_VARS})
     try:
-        if len(sig.parameters) >= 3:
-            y = generate_fn(sr, duration, {})
-        else:
-            y = generate_fn(sr, duration)
-    except TypeError:
-        y = generate_fn(sr, duration)
+        pool = mp.Pool(workers)
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
 
-    write_wav(out_path, sr, y)
+    with pool:
+        return pool.starmap(_render_one, args)
 
 
 if __name__ == "__main__":
-    print("This module provides render_cli().")
+    if len(sys.argv) < 5 or len(sys.argv) % 2 == 0:
+        print("This module provides render_cli() and render_batch().")
+        print("Usage: python _render_util.py sample_rate duration_seconds "
+              "synth.py output.wav [synth.py output.wav ...]")
+        sys.exit(0 if len(sys.argv) == 1 else 1)
+
+    pairs = list(zip(sys.argv[3::2], sys.argv[4::2]))
+    render_batch(pairs, int(float(sys.argv[1])), float(sys.argv[2]))
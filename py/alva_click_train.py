@@ -1,5 +1,7 @@
 import numpy as np
 
+from _render_util import decay_ramp, mono_to_stereo
+
 
 def generate(sr: int, duration: float, context=None):
     n = int(sr * duration)
@@ -11,14 +13,21 @@ def generate(sr: int, duration: float, context=None):
     spacing = max(1, int(sr / rate))
     click_len = max(1, int(0.002 * sr))
 
-    for i in range(0, n, spacing):
-        end = min(n, i + click_len)
-        env = np.linspace(1.0, 0.0, end - i, dtype=np.float32)
-        y[i:end] += env * 0.9
+    env = decay_ramp(click_len) * 0.9
+
+    # One click per `spacing` cell: view the whole cells as rows and add the
+    # envelope into the leading columns in a single pass.
+    cells = n // spacing
+    y[: cells * spacing].reshape(cells, spacing)[:, :click_len] += env
+
+    tail = n - cells * spacing
+    if tail > 0:
+        end = min(tail, click_len)
+        tail_env = decay_ramp(end)
+        y[cells * spacing : cells * spacing + end] += tail_env * 0.9
 
     y = np.clip(y, -1.0, 1.0)
-    stereo = np.stack([y, y], axis=1)
-    return stereo.astype(np.float32)
+    return mono_to_stereo(y)
 
 
 if __name__ == "__main__":
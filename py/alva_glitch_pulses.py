@@ -1,22 +1,35 @@
 import numpy as np
 
+from _render_util import mono_to_stereo, time_axis
+
 
 def generate(sr: int, duration: float, context=None):
     n = int(sr * duration)
     if n <= 0:
         return np.zeros((0,), dtype=np.float32)
 
-    t = np.arange(n, dtype=np.float32) / float(sr)
+    t = time_axis(n, sr)
     base = 220.0
     pulse_rate = 5.5
-    gate = (np.sin(2.0 * np.pi * pulse_rate * t) > 0).astype(np.float32)
-    tone = np.sin(2.0 * np.pi * base * t) * 0.4
-    tick = np.sign(np.sin(2.0 * np.pi * 60.0 * t)) * 0.1
-    y = (tone + tick) * gate
-
-    y = np.clip(y, -1.0, 1.0)
-    stereo = np.stack([y, y], axis=1)
-    return stereo.astype(np.float32)
+
+    # Build tone, tick and gate in place over two buffers rather than
+    # materializing each as its own full-length temporary.
+    y = np.multiply(t, 2.0 * np.pi * base)
+    np.sin(y, out=y)
+    y *= 0.4
+
+    buf = np.multiply(t, 2.0 * np.pi * 60.0)
+    np.sin(buf, out=buf)
+    np.sign(buf, out=buf)
+    buf *= 0.1
+    y += buf
+
+    np.multiply(t, 2.0 * np.pi * pulse_rate, out=buf)
+    np.sin(buf, out=buf)
+    y[buf <= 0] = 0.0
+
+    np.clip(y, -1.0, 1.0, out=y)
+    return mono_to_stereo(y)
 
 
 if __name__ == "__main__":
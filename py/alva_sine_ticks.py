@@ -1,5 +1,7 @@
 import numpy as np
 
+from _render_util import decay_ramp, mono_to_stereo, time_axis
+
 
 def generate(sr: int, duration: float, context=None):
     n = int(sr * duration)
@@ -11,15 +13,24 @@ def generate(sr: int, duration: float, context=None):
     tick_len = max(1, int(0.01 * sr))
     freq = 900.0
 
-    for i in range(0, n, tick_every):
-        end = min(n, i + tick_len)
-        t = np.arange(end - i, dtype=np.float32) / float(sr)
-        env = np.linspace(1.0, 0.0, end - i, dtype=np.float32)
-        y[i:end] += np.sin(2.0 * np.pi * freq * t) * env * 0.6
+    # Every tick is identical, so synthesize it once and add it into the
+    # leading columns of each whole `tick_every` cell in a single pass.
+    t = time_axis(tick_len, sr)
+    tone = np.sin(2.0 * np.pi * freq * t)
+    env = decay_ramp(tick_len)
+    tick = tone * env * 0.6
+
+    cells = n // tick_every
+    y[: cells * tick_every].reshape(cells, tick_every)[:, :tick_len] += tick
+
+    tail = n - cells * tick_every
+    if tail > 0:
+        end = min(tail, tick_len)
+        tail_env = decay_ramp(end)
+        y[cells * tick_every : cells * tick_every + end] += tone[:end] * tail_env * 0.6
 
     y = np.clip(y, -1.0, 1.0)
-    stereo = np.stack([y, y], axis=1)
-    return stereo.astype(np.float32)
+    return mono_to_stereo(y)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import numpy as np
 
+from _render_util import decay_ramp, mono_to_stereo
+
 
 def generate(sr: int, duration: float, context=None):
     n = int(sr * duration)
@@ -11,16 +13,17 @@ def generate(sr: int, duration: float, context=None):
     burst_count = max(1, int(duration * 6.0))
     burst_len = max(1, int(0.015 * sr))
 
-    for _ in range(burst_count):
-        start = int(rng.integers(0, max(1, n - burst_len)))
-        end = min(n, start + burst_len)
-        noise = rng.uniform(-1.0, 1.0, end - start).astype(np.float32)
-        env = np.linspace(1.0, 0.0, end - start, dtype=np.float32)
-        y[start:end] += noise * env * 0.4
+    # All bursts share one length, so draw them as a (burst_count, L) block
+    # and scatter-add it; np.add.at keeps overlapping bursts summing.
+    burst_len = min(burst_len, n)
+    starts = rng.integers(0, max(1, n - burst_len), size=burst_count)
+    noise = rng.uniform(-1.0, 1.0, (burst_count, burst_len)).astype(np.float32)
+    env = decay_ramp(burst_len) * 0.4
+    idx = starts[:, None] + np.arange(burst_len)[None, :]
+    np.add.at(y, idx, noise * env)
 
     y = np.clip(y, -1.0, 1.0)
-    stereo = np.stack([y, y], axis=1)
-    return stereo.astype(np.float32)
+    return mono_to_stereo(y)
 
 
 if __name__ == "__main__":
@@ -1,25 +1,24 @@
 import numpy as np
 
+from _render_util import mono_to_stereo, time_axis
 
-def _kick(n, sr, freq=55.0, decay=0.14):
-    t = np.arange(n, dtype=np.float32) / float(sr)
+
+def _kick(t, freq=55.0, decay=0.14):
     env = np.exp(-t / decay)
     sweep = np.exp(-t * 7.0)
     return np.sin(2.0 * np.pi * (freq * (1.0 + 3.0 * sweep)) * t) * env
 
 
-def _snare(n, sr, decay=0.1):
-    t = np.arange(n, dtype=np.float32) / float(sr)
+def _snare(t, rng, decay=0.1):
     env = np.exp(-t / decay)
-    noise = np.random.uniform(-1.0, 1.0, n).astype(np.float32)
+    noise = rng.random(len(t), dtype=np.float32) * 2.0 - 1.0
     tone = np.sin(2.0 * np.pi * 200.0 * t) * 0.25
     return (noise * 0.8 + tone) * env
 
 
-def _hat(n, sr, decay=0.035):
-    t = np.arange(n, dtype=np.float32) / float(sr)
+def _hat(t, rng, decay=0.035):
     env = np.exp(-t / decay)
-    noise = np.random.uniform(-1.0, 1.0, n).astype(np.float32)
+    noise = rng.random(len(t), dtype=np.float32) * 2.0 - 1.0
     return noise * env * 0.3
 
 
@@ -38,26 +37,28 @@ def generate(sr: int, duration: float, context=None):
     snare_steps = {4, 12}
     hat_steps = {1, 3, 5, 7, 9, 11, 13, 15}
 
+    rng = np.random.default_rng(7)
+    t = time_axis(int(0.6 * sr), sr)  # the kick is the longest hit
+    kick = _kick(t)
+    snare = _snare(t[: int(0.3 * sr)], rng)
+    hat = _hat(t[: int(0.12 * sr)], rng)
+
     for s in range(steps):
         start = int(s * step * sr)
         if start >= n:
             break
         if s in kick_steps:
-            k = _kick(int(0.6 * sr), sr)
-            end = min(n, start + len(k))
-            y[start:end] += k[: end - start]
+            end = min(n, start + len(kick))
+            y[start:end] += kick[: end - start]
         if s in snare_steps:
-            sn = _snare(int(0.3 * sr), sr)
-            end = min(n, start + len(sn))
-            y[start:end] += sn[: end - start]
+            end = min(n, start + len(snare))
+            y[start:end] += snare[: end - start]
         if s in hat_steps:
-            h = _hat(int(0.12 * sr), sr)
-            end = min(n, start + len(h))
-            y[start:end] += h[: end - start]
+            end = min(n, start + len(hat))
+            y[start:end] += hat[: end - start]
 
     y = np.clip(y, -1.0, 1.0)
-    stereo = np.stack([y, y], axis=1)
-    return stereo.astype(np.float32)
+    return mono_to_stereo(y)
 
 
 if __name__ == "__main__":
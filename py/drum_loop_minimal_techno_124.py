@@ -1,24 +1,23 @@
 import numpy as np
 
+from _render_util import mono_to_stereo, time_axis
 
-def _kick(n, sr, freq=48.0, decay=0.16):
-    t = np.arange(n, dtype=np.float32) / float(sr)
+
+def _kick(t, freq=48.0, decay=0.16):
     env = np.exp(-t / decay)
     sweep = np.exp(-t * 8.0)
     return np.sin(2.0 * np.pi * (freq * (1.0 + 4.0 * sweep)) * t) * env
 
 
-def _hat(n, sr, decay=0.02):
-    t = np.arange(n, dtype=np.float32) / float(sr)
+def _hat(t, rng, decay=0.02):
     env = np.exp(-t / decay)
-    noise = np.random.uniform(-1.0, 1.0, n).astype(np.float32)
+    noise = rng.random(len(t), dtype=np.float32) * 2.0 - 1.0
     return noise * env * 0.2
 
 
-def _clap(n, sr, decay=0.06):
-    t = np.arange(n, dtype=np.float32) / float(sr)
+def _clap(t, rng, decay=0.06):
     env = np.exp(-t / decay)
-    noise = np.random.uniform(-1.0, 1.0, n).astype(np.float32)
+    noise = rng.random(len(t), dtype=np.float32) * 2.0 - 1.0
     return noise * env * 0.5
 
 
@@ -37,26 +36,28 @@ def generate(sr: int, duration: float, context=None):
     hat_steps = {2, 6, 10, 14}
     clap_steps = {4, 12}
 
+    rng = np.random.default_rng(7)
+    t = time_axis(int(0.5 * sr), sr)  # the kick is the longest hit
+    kick = _kick(t)
+    clap = _clap(t[: int(0.2 * sr)], rng)
+    hat = _hat(t[: int(0.08 * sr)], rng)
+
     for s in range(steps):
         start = int(s * step * sr)
         if start >= n:
             break
         if s in kick_steps:
-            k = _kick(int(0.5 * sr), sr)
-            end = min(n, start + len(k))
-            y[start:end] += k[: end - start]
+            end = min(n, start + len(kick))
+            y[start:end] += kick[: end - start]
         if s in clap_steps:
-            c = _clap(int(0.2 * sr), sr)
-            end = min(n, start + len(c))
-            y[start:end] += c[: end - start]
+            end = min(n, start + len(clap))
+            y[start:end] += clap[: end - start]
         if s in hat_steps:
-            h = _hat(int(0.08 * sr), sr)
-            end = min(n, start + len(h))
-            y[start:end] += h[: end - start]
+            end = min(n, start + len(hat))
+            y[start:end] += hat[: end - start]
 
     y = np.clip(y, -1.0, 1.0)
-    stereo = np.stack([y, y], axis=1)
-    return stereo.astype(np.float32)
+    return mono_to_stereo(y)
 
 
 if __name__ == "__main__":
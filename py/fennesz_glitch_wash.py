@@ -1,5 +1,7 @@
 import numpy as np
 
+from _render_util import mono_to_stereo, time_axis
+
 
 def generate(sr: int, duration: float, context=None):
     n = int(sr * duration)
@@ -7,7 +9,7 @@ def generate(sr: int, duration: float, context=None):
         return np.zeros((0,), dtype=np.float32)
 
     rng = np.random.default_rng(12)
-    t = np.arange(n, dtype=np.float32) / float(sr)
+    t = time_axis(n, sr)
 
     base = np.sin(2.0 * np.pi * 90.0 * t) * 0.15
     noise = rng.uniform(-1.0, 1.0, n).astype(np.float32) * 0.06
@@ -26,8 +28,7 @@ def generate(sr: int, duration: float, context=None):
     y *= slow
     y = np.tanh(y * 1.4).astype(np.float32)
 
-    stereo = np.stack([y, y], axis=1)
-    return stereo
+    return mono_to_stereo(y)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import numpy as np
 
+from _render_util import fade_ramp
+
 def generate(sr: int, duration: float) -> np.ndarray:
     """
     Glitch tone fragments:
@@ -35,7 +37,7 @@ def generate(sr: int, duration: float) -> np.ndarray:
 
     f = min(int(0.01*sr), n//2)
     if f > 1:
-        ramp = np.linspace(0, 1, f, endpoint=True).astype(np.float32)
+        ramp = fade_ramp(f)
         y[:f] *= ramp
         y[-f:] *= ramp[::-1]
     return y
@@ -1,5 +1,7 @@
 import numpy as np
 
+from _render_util import fade_ramp
+
 def generate(sr: int, duration: float) -> np.ndarray:
     """
     Granular chop drift:
@@ -58,7 +60,7 @@ def generate(sr: int, duration: float) -> np.ndarray:
     y = np.tanh(y * 1.35).astype(np.float32) * 0.85
     f = min(int(0.01*sr), n//2)
     if f > 1:
-        ramp = np.linspace(0, 1, f, endpoint=True).astype(np.float32)
+        ramp = fade_ramp(f)
         y[:f] *= ramp
         y[-f:] *= ramp[::-1]
     return y
@@ -1,5 +1,7 @@
 import numpy as np
 
+from _render_util import fade_ramp
+
 def generate(sr:int, duration:float, context:dict) -> np.ndarray:
     """
     Cellwise degrade loop:
@@ -28,25 +30,21 @@ def generate(sr:int, duration:float, context:dict) -> np.ndarray:
             bits = int(7 - scar*4)  # fewer bits as scar increases
             bits = max(2, min(8, bits))
             q = float(2**bits - 1)
-            gen = np.round(gen*q)/q
+            gen *= q; np.round(gen, out=gen); gen /= q
         if rng.random() < (0.15 + 0.55*scar):
             a = int(rng.integers(0, len(gen)))
             b = int(min(len(gen), a + rng.integers(len(gen)//10, len(gen)//2)))
-            gen[a:b] *= 0.0
+            gen[a:b] = 0.0
         if rng.random() < (0.10 + 0.30*scar):
             gen += float(rng.uniform(-0.01, 0.01))*scar
 
-    y = np.zeros(n, dtype=np.float32)
-    pos = 0
-    while pos < n:
-        L = min(len(gen), n-pos)
-        y[pos:pos+L] += gen[:L]
-        pos += L
+    # np.resize repeats gen end to end to fill n samples
+    y = np.resize(gen, n)
 
-    y = np.tanh(y*1.3).astype(np.float32)*0.8
+    y *= 1.3; np.tanh(y, out=y); y *= 0.8
     f = min(int(0.01*sr), n//2)
     if f>1:
-        ramp=np.linspace(0,1,f,endpoint=True).astype(np.float32)
+        ramp=fade_ramp(f)
         y[:f]*=ramp; y[-f:]*=ramp[::-1]
     return y
 
@@ -1,5 +1,7 @@
 import numpy as np
 
+from _render_util import fade_ramp
+
 def generate(sr:int, duration:float, context:dict) -> np.ndarray:
     """
     Skip density by position:
@@ -21,33 +23,32 @@ def generate(sr:int, duration:float, context:dict) -> np.ndarray:
 
     # more damage as p increases
     events=int(2 + 12*p)
+    mode = 0 if p<0.33 else (1 if p<0.66 else 2)
     for _ in range(events):
         a=int(rng.integers(0,n))
         L=int(rng.uniform(0.004, 0.06)*sr)
         L=max(16, min(L, n-a))
         if L<=0: continue
-        mode = 0 if p<0.33 else (1 if p<0.66 else 2)
         if mode==0:
-            # tiny repeats
-            frag=y[a:a+L].copy()
+            # tiny repeats (the first copy would land on itself)
+            frag=y[a:a+L]
             reps=int(rng.integers(2, 4))
-            for r in range(reps):
+            for r in range(1, reps):
                 aa=a+r*L; bb=min(n, aa+L)
                 if bb>aa: y[aa:bb]=frag[:bb-aa]
         elif mode==1:
-            # stutter/decimate
+            # stutter/decimate: hold every step-th sample for step samples
             step=int(rng.integers(4, 32))
-            frag=y[a:a+L].copy()
-            frag=np.repeat(frag[::step], step)[:L]
-            y[a:a+L]=frag.astype(np.float32)
+            held=y[a:a+L:step]
+            y[a:a+L]=np.broadcast_to(held[:, None], (held.size, step)).reshape(-1)[:L]
         else:
             # dropout
-            y[a:a+L]*=0.0
+            y[a:a+L]=0.0
 
     y=np.tanh(y*1.6).astype(np.float32)*0.85
     f=min(int(0.01*sr), n//2)
     if f>1:
-        ramp=np.linspace(0,1,f,endpoint=True).astype(np.float32)
+        ramp=fade_ramp(f)
         y[:f]*=ramp; y[-f:]*=ramp[::-1]
     return y
 
@@ -1,14 +1,17 @@
 import numpy as np
 
+from _render_util import mono_to_stereo, time_axis
+
 def generate(sr: int, duration: float, context=None):
     n = int(sr * duration)
     if n <= 0:
         return np.zeros((0,), dtype=np.float32)
     freq = 220.0
-    t = np.arange(n, dtype=np.float32) / float(sr)
-    y = 0.2 * np.sin(2.0 * np.pi * freq * t)
-    stereo = np.stack([y, y], axis=1).astype(np.float32)
-    return stereo
+    t = time_axis(n, sr)
+    y = np.multiply(t, 2.0 * np.pi * freq)
+    np.sin(y, out=y)
+    y *= 0.2
+    return mono_to_stereo(y)
 
 
 if __name__ == "__main__":